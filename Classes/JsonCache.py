@@ -0,0 +1,72 @@
+"""Sidecar JSON cache module for derived data that is expensive to rebuild."""
+
+import json
+import os
+import tempfile
+from typing import Any, Optional
+
+
+class JsonCache:
+    """Stores data derived from a source file in a JSON file next to it.
+
+    The cache records the source file's modification time and size and is
+    only used while both still match exactly, so replacing the source with
+    any other version (even an older one) invalidates it.
+    """
+
+    def __init__(self, cache_file: str, source_file: str):
+        """Initialize the cache for a source file.
+
+        Args:
+            cache_file: Path to the JSON cache file
+            source_file: Path to the file the cached data is derived from
+
+        Raises:
+            FileNotFoundError: If the source file doesn't exist
+        """
+        self.cache_file = cache_file
+        stat = os.stat(source_file)
+        self.signature = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+    def load(self) -> Optional[Any]:
+        """Load the cached data if it was built from the current source file.
+
+        Returns:
+            Cached data, or None if the cache is missing, stale or malformed
+        """
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as file:
+                cached = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(cached, dict) or cached.get("source") != self.signature:
+            return None
+        return cached.get("data")
+
+    def store(self, data: Any) -> None:
+        """Write data to the cache file atomically.
+
+        Failures are ignored; the cache is optional, so read-only
+        directories still work.
+
+        Args:
+            data: JSON-serializable data to store
+        """
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(self.cache_file) or ".", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as file:
+                    json.dump(
+                        {"source": self.signature, "data": data},
+                        file,
+                        ensure_ascii=False,
+                    )
+                os.replace(tmp_path, self.cache_file)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass
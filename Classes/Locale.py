@@ -1,9 +1,67 @@
 """Locale management module for internationalization support."""
 
+import functools
 import os
 import yaml
 from typing import Dict, Optional
 
+from Classes.JsonCache import JsonCache
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    # Fallback if PyYAML was built without LibYAML
+    from yaml import SafeLoader as _SafeLoader
+
+
+@functools.lru_cache(maxsize=16)
+def _load_locale(locale_dir: str, code: str) -> Dict[str, str]:
+    """Load and parse translations for a locale, memoized per process.
+    
+    The returned dictionary is shared between callers and must not be mutated.
+    
+    Args:
+        locale_dir: Directory containing locale files
+        code: Locale code (e.g., 'en', 'tr')
+        
+    Returns:
+        Parsed translations
+        
+    Raises:
+        FileNotFoundError: If the locale file doesn't exist
+    """
+    locale_file = os.path.join(locale_dir, f"{code}.yml")
+    cache_file = os.path.join(locale_dir, f".{code}.yml.json")
+    
+    cache = JsonCache(cache_file, locale_file)
+    cached = cache.load()
+    if isinstance(cached, dict):
+        return cached
+    
+    with open(locale_file, 'r', encoding='utf-8') as file:
+        translations = yaml.load(file, Loader=_SafeLoader) or {}
+    cache.store(translations)
+    return translations
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_system_locale_cached() -> str:
+    """Detect system locale from environment variables, once per process.
+    
+    Returns:
+        Detected locale code (e.g., 'en', 'tr')
+    """
+    # Try to get locale from environment variables
+    lang = os.environ.get('LANG', '').lower()
+    lc_all = os.environ.get('LC_ALL', '').lower()
+    
+    # Check for Turkish locale
+    if 'tr' in lang or 'tr' in lc_all:
+        return 'tr'
+    
+    # Default to English
+    return 'en'
+
 
 class Locale:
     """Manages application localization and internationalization."""
@@ -17,6 +75,8 @@ class Locale:
         self.locale_dir = locale_dir
         self.current_locale = self._detect_system_locale()
         self.translations: Dict[str, str] = {}
+        self._available: Optional[Dict[str, str]] = None
+        self._available_mtime: Optional[float] = None
         self.load_translations()
     
     def _detect_system_locale(self) -> str:
@@ -25,24 +85,12 @@ class Locale:
         Returns:
             Detected locale code (e.g., 'en', 'tr')
         """
-        # Try to get locale from environment variables
-        lang = os.environ.get('LANG', '').lower()
-        lc_all = os.environ.get('LC_ALL', '').lower()
-        
-        # Check for Turkish locale
-        if 'tr' in lang or 'tr' in lc_all:
-            return 'tr'
-        
-        # Default to English
-        return 'en'
+        return _detect_system_locale_cached()
     
     def load_translations(self) -> None:
         """Load translations for the current locale."""
-        locale_file = os.path.join(self.locale_dir, f"{self.current_locale}.yml")
-        
         try:
-            with open(locale_file, 'r', encoding='utf-8') as file:
-                self.translations = yaml.safe_load(file) or {}
+            self.translations = _load_locale(self.locale_dir, self.current_locale)
         except FileNotFoundError:
             # Fallback to English if locale file not found
             if self.current_locale != 'en':
@@ -51,6 +99,7 @@ class Locale:
             else:
                 self.translations = {}
         except Exception as e:
+            locale_file = os.path.join(self.locale_dir, f"{self.current_locale}.yml")
             print(f"Error loading locale file {locale_file}: {e}")
             self.translations = {}
     
@@ -89,9 +138,18 @@ class Locale:
         Returns:
             Dictionary of locale codes and their display names
         """
+        try:
+            mtime: Optional[float] = os.stat(self.locale_dir).st_mtime
+        except OSError:
+            mtime = None
+        
+        # Only rescan the directory when its contents may have changed
+        if self._available is not None and mtime == self._available_mtime:
+            return dict(self._available)
+        
         locales = {}
         
-        if os.path.exists(self.locale_dir):
+        if mtime is not None:
             for file in os.listdir(self.locale_dir):
                 if file.endswith('.yml'):
                     locale_code = file[:-4]  # Remove .yml extension
@@ -102,4 +160,6 @@ class Locale:
                     else:
                         locales[locale_code] = locale_code.title()
         
-        return locales
\ No newline at end of file
+        self._available = locales
+        self._available_mtime = mtime
+        return dict(locales)
\ No newline at end of file
@@ -3,7 +3,7 @@
 import os
 import platform
 import subprocess
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
 try:
     from colorama import Fore, Style
@@ -22,12 +22,30 @@ except ImportError:
 
 class OperatingSystem:
     """Provides operating system information and detection capabilities."""
+
+    # Probe results shared by all instances, keyed by os.name
+    _cache: Dict[str, Dict[str, Any]] = {}
     
     def __init__(self):
         """Initialize OS information."""
         self.name = os.name
-        self.info = self._get_system_info()
-        self.distro = self._get_distribution_info()
+        self._probes = OperatingSystem._cache.setdefault(self.name, {})
+        self.info = self._cached("info", self._get_system_info)
+        self.distro = self._cached("distro", self._get_distribution_info)
+
+    def _cached(self, key: str, probe: Callable[[], Any]) -> Any:
+        """Return a cached probe result, running the probe on first use.
+        
+        Args:
+            key: Cache key for the probe result
+            probe: Callable that computes the value
+            
+        Returns:
+            Cached or freshly computed probe result
+        """
+        if key not in self._probes:
+            self._probes[key] = probe()
+        return self._probes[key]
 
     def _get_system_info(self) -> object:
         """Get system information based on the operating system.
@@ -60,6 +78,14 @@ class OperatingSystem:
         Returns:
             Linux distribution name
         """
+        try:
+            # Python 3.10+ reads /etc/os-release directly; ID mirrors `lsb_release -i`
+            distro_id = platform.freedesktop_os_release().get("ID")
+            if distro_id:
+                return distro_id.capitalize()
+        except (AttributeError, OSError):
+            pass
+
         try:
             result = subprocess.check_output(["lsb_release", "-i", "-s"], timeout=5)
             return result.decode().strip()
@@ -69,6 +95,14 @@ class OperatingSystem:
     def _get_windows_info(self) -> str:
         """Get Windows version information.
         
+        Returns:
+            Windows version string
+        """
+        return self._cached("windows", self._probe_windows_info)
+
+    def _probe_windows_info(self) -> str:
+        """Probe Windows version information.
+        
         Returns:
             Windows version string
         """
@@ -100,15 +134,19 @@ class OperatingSystem:
     def get_kernel_version(self) -> str:
         """Get kernel version information.
         
+        Returns:
+            Kernel version string
+        """
+        return self._cached("kernel", self._get_kernel_version)
+
+    def _get_kernel_version(self) -> str:
+        """Probe kernel version information.
+        
         Returns:
             Kernel version string
         """
         if self.name == "posix":
-            try:
-                result = subprocess.check_output(["uname", "-r"], timeout=5)
-                return result.decode().strip()
-            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-                return getattr(self.info, "release", "Unknown")
+            return os.uname().release
         elif self.name == "nt":
             return self._get_windows_info()
         else:
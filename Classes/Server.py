@@ -1,15 +1,130 @@
 """Server module for managing server data and ping operations."""
 
+import functools
 import json
 import os
 import subprocess
+import sys
+import threading
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from Classes.JsonCache import JsonCache
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    # Fallback to the standard library parser if orjson is not available
+    def _loads(data: bytes) -> dict:
+        return json.loads(data.decode("utf-8"))
+
+# Bump whenever the structure returned by _build_index changes
+_INDEX_VERSION = 1
+
+# Platform-specific ping arguments, resolved once since os.name never changes
+if os.name == "posix":
+    _PING_PREFIX: Optional[List[str]] = ["ping", "-c", "6"]
+elif os.name == "nt":
+    _PING_PREFIX = ["ping", "-n", "6"]
+else:
+    _PING_PREFIX = None
+
+# Seconds a single ping run may take before it is killed
+_PING_TIMEOUT = 30
+
+
+@functools.lru_cache(maxsize=4)
+def _load_json(path: str, mtime: float) -> dict:
+    """Load and parse a JSON file, memoized by path and modification time.
+
+    The returned dictionary is shared between callers and must not be mutated.
+
+    Args:
+        path: Path to the JSON file
+        mtime: Modification time of the file, used to invalidate the cache
+
+    Returns:
+        Parsed JSON data as dictionary
+    """
+    return _loads(Path(path).read_bytes())
+
+
+def _build_index(data: dict) -> dict:
+    """Build the country index for parsed datacenter data.
+
+    Args:
+        data: Parsed datacenter JSON data
+
+    Returns:
+        Dictionary with the index "version", sorted "countries" and a
+        "by_country" mapping of lower-cased country name to (name, ip) pairs
+    """
+    countries = set()
+    by_country: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+
+    for server_data in data.get("datacenter", {}).values():
+        countries.add(str(server_data.get("country", "Unknown") or "Unknown"))
+        by_country[str(server_data.get("country") or "").lower()].append(
+            (server_data.get("name", "Unknown"), server_data.get("ip", "0.0.0.0"))
+        )
+
+    return {
+        "version": _INDEX_VERSION,
+        "countries": sorted(countries),
+        "by_country": dict(by_country),
+    }
+
+
+def _is_current_index(index: object) -> bool:
+    """Check that cached data is an index built by this version of _build_index.
+
+    Args:
+        index: Data loaded from the index cache
+
+    Returns:
+        True if the index can be used as is
+    """
+    return (
+        isinstance(index, dict)
+        and index.get("version") == _INDEX_VERSION
+        and isinstance(index.get("countries"), list)
+        and isinstance(index.get("by_country"), dict)
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_index(path: str, mtime: float) -> dict:
+    """Load the country index for a datacenter JSON file.
+
+    The index is cached on disk as JSON next to the source file and
+    memoized per process by path and modification time.
+
+    Args:
+        path: Path to the JSON file
+        mtime: Modification time of the file, used to invalidate the cache
+
+    Returns:
+        Index as built by _build_index
+    """
+    directory, name = os.path.split(path)
+    cache_file = os.path.join(directory, f".{name}.index.json")
+
+    cache = JsonCache(cache_file, path)
+    index = cache.load()
+    if not _is_current_index(index):
+        index = _build_index(_load_json(path, mtime))
+        cache.store(index)
+    return index
 
 
 class Server:
     """Represents a server with name and IP address for ping testing."""
 
+    __slots__ = ("name", "ip_address")
+
     def __init__(self, name: Optional[str] = None, ip_address: Optional[str] = None):
         """Initialize a server instance.
 
@@ -33,9 +148,38 @@ class Server:
             FileNotFoundError: If the JSON file doesn't exist
             json.JSONDecodeError: If the JSON file is malformed
         """
+        return _load_json(*self._data_key(json_file))
+
+    def _data_key(self, json_file: str) -> Tuple[str, float]:
+        """Build the cache key for a JSON file in the Data directory.
+
+        Args:
+            json_file: Name of the JSON file in the Data directory
+
+        Returns:
+            Tuple of file path and modification time
+
+        Raises:
+            FileNotFoundError: If the JSON file doesn't exist
+        """
         data_path = Path("Data") / json_file
-        with open(data_path, "r", encoding="utf-8") as file:
-            return json.load(file)
+        return str(data_path), os.path.getmtime(data_path)
+
+    def preload(self, json_files: List[str]) -> None:
+        """Warm the datacenter index caches for the given JSON files.
+
+        Missing or malformed files are skipped here; errors are reported when
+        the data is actually requested.
+
+        Args:
+            json_files: Names of JSON files in the Data directory
+        """
+        for json_file in json_files:
+            try:
+                _load_index(*self._data_key(json_file))
+            except Exception:
+                # Reported by get_countries/get_servers_by_country on use
+                continue
 
     def get_countries(self, json_file: str) -> List[str]:
         """Extract unique countries from the JSON data.
@@ -47,12 +191,7 @@ class Server:
             Sorted list of unique country names
         """
         try:
-            data = self.load_data_from_json(json_file)
-            countries = {
-                server_data.get("country", "Unknown") or "Unknown"
-                for server_data in data.get("datacenter", {}).values()
-            }
-            return sorted([str(country) for country in countries])
+            return list(_load_index(*self._data_key(json_file))["countries"])
         except (FileNotFoundError, json.JSONDecodeError, Exception) as e:
             print(f"Error reading countries from {json_file}: {e}")
             return []
@@ -68,18 +207,12 @@ class Server:
             List of Server objects in the specified country
         """
         try:
-            data = self.load_data_from_json(json_file)
-            servers = []
-
-            for server_data in data.get("datacenter", {}).values():
-                if server_data.get("country", "").lower() == country.lower():
-                    server = Server(
-                        name=server_data.get("name", "Unknown"),
-                        ip_address=server_data.get("ip", "0.0.0.0"),
-                    )
-                    servers.append(server)
-
-            return servers
+            index = _load_index(*self._data_key(json_file))
+
+            return [
+                Server(name=name, ip_address=ip_address)
+                for name, ip_address in index["by_country"].get(country.lower(), [])
+            ]
         except (FileNotFoundError, json.JSONDecodeError, Exception) as e:
             print(f"Error reading servers from {json_file}: {e}")
             return []
@@ -100,15 +233,38 @@ class Server:
 
         try:
             ping_command = self._build_ping_command()
-            result = subprocess.run(
-                ping_command, capture_output=True, text=True, timeout=30
-            )
-            print(result.stdout)
+            with subprocess.Popen(
+                ping_command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+            ) as process:
+                timed_out = threading.Event()
+
+                def _kill() -> None:
+                    timed_out.set()
+                    process.kill()
+
+                # Enforce the timeout while output is being streamed
+                watchdog = threading.Timer(_PING_TIMEOUT, _kill)
+                watchdog.start()
+                try:
+                    for line in process.stdout:
+                        sys.stdout.write(line)
+                        sys.stdout.flush()
+                    stderr = process.stderr.read()
+                    returncode = process.wait()
+                finally:
+                    watchdog.cancel()
+
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(ping_command, _PING_TIMEOUT)
 
-            if result.returncode == 0:
+            if returncode == 0:
                 return True
             else:
-                print(f"Ping failed for {self.name}: {result.stderr}")
+                print(f"Ping failed for {self.name}: {stderr}")
                 return False
 
         except subprocess.TimeoutExpired:
@@ -127,9 +283,6 @@ class Server:
         Raises:
             NotImplementedError: If the operating system is not supported
         """
-        if os.name == "posix":
-            return ["ping", "-c", "6", self.ip_address]
-        elif os.name == "nt":
-            return ["ping", "-n", "6", self.ip_address]
-        else:
+        if _PING_PREFIX is None:
             raise NotImplementedError(f"Unsupported operating system: {os.name}")
+        return [*_PING_PREFIX, self.ip_address]
@@ -20,20 +20,60 @@ class PingTesterApp:
         self.os_info = OperatingSystem()
         self.server = Server()
         self.locale = Locale()
+        self._preload: Optional[asyncio.Future] = None
+        self._ansi_enabled = os.name != "nt" or self._enable_windows_ansi()
+
+    def _enable_windows_ansi(self) -> bool:
+        """Enable ANSI escape sequence processing on the Windows console.
+
+        Returns:
+            True if the console now processes ANSI escape sequences
+        """
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            kernel32 = ctypes.windll.kernel32
+            kernel32.GetStdHandle.restype = wintypes.HANDLE
+            handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+            mode = ctypes.c_uint32()
+            if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                return False
+            # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+        except Exception:
+            return False
     
     def clear_console(self) -> None:
         """Clear the console screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if not self._ansi_enabled:
+            os.system("cls")
+            return
+
+        # Same sequence `clear` emits: home, clear screen, clear scrollback
+        sys.stdout.write("\x1b[H\x1b[2J\x1b[3J")
+        sys.stdout.flush()
 
     async def initialize(self) -> None:
-        """Initialize the application and display system information."""
-        self.clear_console()
-        self.os_info.display_system_info(locale=self.locale)
-        await asyncio.sleep(1)
+        """Initialize the application and start preloading server data."""
+        # Load server data in the background while the user reads the menu
+        loop = asyncio.get_running_loop()
+        self._preload = loop.run_in_executor(
+            None, self.server.preload, [self.JSON_FILES["datacenter"]]
+        )
+
+    async def _wait_for_preload(self) -> None:
+        """Wait for the background server data preload to finish, if running."""
+        if self._preload is not None:
+            try:
+                await self._preload
+            finally:
+                self._preload = None
 
     def display_main_menu(self) -> None:
         """Display the main menu options."""
         self.clear_console()
+        self.os_info.display_system_info(locale=self.locale)
         print(f"\n{self.locale.get('welcome')}")
         print(f"\n{self.locale.get('select_option')}")
         print(f"1. {self.locale.get('list_isp')}")
@@ -175,6 +215,7 @@ class PingTesterApp:
                 choice = input(self.locale.get("enter_choice") + " ").lower()
 
                 if choice in {"1", "datacenter"}:
+                    await self._wait_for_preload()
                     self.handle_datacenter_menu()
                 elif choice in {"2", "game"}:
                     self.handle_game_menu()